@@ -1,98 +1,170 @@
+from __future__ import annotations
+
 import csv
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, ClassVar, Protocol, Type
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator, Mapping
 
-import app_config
-import d
-import pandas as pd
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-class FileHandler(Protocol):
-    @classmethod
-    def load(cls, path: Path) -> dict | str | list[dict[str, str]]: ...
 
-    @classmethod
-    def save(cls, data: dict | str | list[dict[str, Any]], path: Path) -> None: ...
+@lru_cache(maxsize=1024)
+def _cached_path(path: str) -> Path:
+    return Path(path)
 
-class JSONFileHandler:
-    @classmethod
-    def load(cls, path: Path) -> dict:
-        return json.load(path.open("r", encoding="utf-8"))
 
-    @classmethod
-    def save(cls, data: dict, path: Path) -> None:
-        path.open("w", encoding="utf-8").write(json.dumps(data, indent=2))
+Loader = Callable[[Path], Any]
+Saver = Callable[[Any, Path], None]
 
-class TextFileHandler:
-    @classmethod
-    def load(cls, path: Path) -> str:
-        return path.read_text(encoding="utf-8")
 
-    @classmethod
-    def save(cls, data: str, path: Path) -> None:
-        path.write_text(data, encoding="utf-8")
+# Handlers are plain (load, save) function pairs: calling one skips the
+# classmethod descriptor that builds a bound method on every call.
+def load_json(path: Path) -> dict:
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
-class CSVFileHandler:
-    @classmethod
-    def load(cls, path: Path) -> list[dict[str, str]]:
-        with path.open("r", newline="", encoding="utf-8") as f:
-            return list(csv.DictReader(f))
 
-    @classmethod
-    def save(cls, data: list[dict[str, Any]], path: Path) -> None:
-        with path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=list(data[0].keys()))
-            writer.writeheader()
-            writer.writerows(data)
+def save_json(data: dict, path: Path, indent: bool = True) -> None:
+    """Write ``data`` as JSON; pass ``indent=False`` for compact (faster) output."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        path.write_bytes(orjson.dumps(data, option=option))
+    elif indent:
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    else:
+        path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+
+
+SMALL_TEXT_SIZE = 1 << 20
+
+
+def load_text(path: Path) -> str:
+    # Read bytes and decode in one call rather than through a TextIOWrapper; small
+    # files take a single os.read on the descriptor already open for the fstat.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size) if size <= SMALL_TEXT_SIZE else None
+    finally:
+        os.close(fd)
+    text = (data if data is not None else path.read_bytes()).decode("utf-8")
+    # match read_text's universal-newline translation
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def save_text(data: str, path: Path) -> None:
+    path.write_text(data, encoding="utf-8")
+
+
+def load_csv(path: Path) -> list[dict[str, str]]:
+    with path.open("r", newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def save_csv(data: list[dict[str, Any]], path: Path) -> None:
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(data[0].keys()))
+        writer.writeheader()
+        writer.writerows(data)
+
+
+# pandas/pyarrow are imported on first use: importing them costs hundreds of ms,
+# which callers that only touch JSON/text/csv files should not pay.
+PANDAS_CHUNKSIZE = 1 << 16
+
+
+@lru_cache(maxsize=1)
+def _pandas() -> tuple[Any, Any]:
+    import pandas
+
+    try:
+        import pyarrow.csv
+    except ImportError:
+        return pandas, None
+    return pandas, pyarrow
+
+
+def load_csv_pandas(path: Path) -> pd.DataFrame:
+    pd, pa = _pandas()
+    # pyarrow's reader is multithreaded; fall back to the C engine without it
+    if pa is not None:
+        return pd.read_csv(path, encoding="utf-8", engine="pyarrow")
+    return pd.read_csv(path, encoding="utf-8")
+
+
+def iter_csv_pandas(path: Path) -> Iterator[pd.DataFrame]:
+    """Yield the CSV in chunks of ``PANDAS_CHUNKSIZE`` rows instead of loading it whole."""
+    pd, _ = _pandas()
+    with pd.read_csv(
+        path, encoding="utf-8", chunksize=PANDAS_CHUNKSIZE, engine="c", low_memory=False
+    ) as reader:
+        yield from reader
+
+
+def save_csv_pandas(data: pd.DataFrame, path: Path) -> None:
+    _, pa = _pandas()
+    if pa is not None:
+        pa.csv.write_csv(pa.Table.from_pandas(data, preserve_index=False), path)
+    else:
+        data.to_csv(path, index=False, encoding="utf-8")
+
 
 class FileManager:
-    _handlers: ClassVar[dict[str, Type[FileHandler]]] = {
-        ".json": JSONFileHandler,
-        ".txt": TextFileHandler,
-        ".log": TextFileHandler,
-        ".md": TextFileHandler,
-        ".csv": CSVFileHandler,
+    # _DISPATCH is only mutated through register_handler; everything else sees the
+    # read-only _handlers view. Hot paths index _DISPATCH directly.
+    _DISPATCH: ClassVar[dict[str, tuple[Loader, Saver]]] = {
+        ".json": (load_json, save_json),
+        ".txt": (load_text, save_text),
+        ".log": (load_text, save_text),
+        ".md": (load_text, save_text),
+        ".csv": (load_csv, save_csv),
     }
-
-    def _to_path(self, path: str | Path) -> Path:
-        return Path(path) if isinstance(path, str) else path
-
-    def _get_handler(self, path: Path) -> Type[FileHandler]:
-        ext = path.suffix.lower()
-        handler = self._handlers.get(ext)
-        if not handler:
-            supported = ", ".join(self._handlers.keys())
-            raise ValueError(
-                f"Unsupported file type: {ext!r}. Supported: {supported}"
-            )
+    _handlers: ClassVar[Mapping[str, tuple[Loader, Saver]]] = MappingProxyType(_DISPATCH)
+
+    @staticmethod
+    def _to_path(path: str | Path) -> Path:
+        return _cached_path(path) if isinstance(path, str) else path
+
+    def _unsupported(self, ext: str) -> ValueError:
+        supported = ", ".join(self._handlers.keys())
+        return ValueError(f"Unsupported file type: {ext!r}. Supported: {supported}")
+
+    # Keys are lowercase, so only lowercase the suffix when the exact lookup misses.
+    def _get_handler(self, path: Path) -> tuple[Loader, Saver]:
+        ext = path.suffix
+        handler = self._DISPATCH.get(ext) or self._DISPATCH.get(ext.lower())
+        if handler is None:
+            raise self._unsupported(ext.lower())
         return handler
 
     def load_file(self, path: str | Path) -> Any:
         p = self._to_path(path)
-        return self._get_handler(p).load(p)
+        return self._get_handler(p)[0](p)
 
     def save_file(self, data: Any, path: str | Path) -> None:
         p = self._to_path(path)
-        self._get_handler(p).save(data, p)
+        self._get_handler(p)[1](data, p)
 
     @classmethod
-    def register_handler(cls, extension: str, handler: Type[FileHandler]) -> None:
+    def register_handler(cls, extension: str, load: Loader, save: Saver) -> None:
         if not extension.startswith("."):
             extension = "." + extension
-        cls._handlers[extension.lower()] = handler
+        cls._DISPATCH[extension.lower()] = (load, save)
 
-# Register pandas-based CSV handler unconditionally
-class PandasCSVHandler:
-    @classmethod
-    def load(cls, path: Path) -> pd.DataFrame:
-        return pd.read_csv(path, encoding="utf-8")
 
-    @classmethod
-    def save(cls, data: pd.DataFrame, path: Path) -> None:
-        data.to_csv(path, index=False, encoding="utf-8")
-
-FileManager.register_handler(".csv", PandasCSVHandler)
+# Register pandas-based CSV handler unconditionally
+FileManager.register_handler(".csv", load_csv_pandas, save_csv_pandas)
 
 
 def main() -> None:
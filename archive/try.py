@@ -1,8 +1,27 @@
 import json
 import logging.config
-import sys
+import threading
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_CONFIGURED = False
+_CONFIGURED_LOCK = threading.Lock()
+
+
+def _configure_once(logging_config: dict) -> None:
+    """Run dictConfig only on the first call in this process."""
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    with _CONFIGURED_LOCK:
+        if not _CONFIGURED:
+            logging.config.dictConfig(logging_config)
+            _CONFIGURED = True
+
 
 class AppConfig:
 
@@ -21,11 +40,8 @@ class AppConfig:
         """
         Load and parse the application's settings from settings.json.
         """
-        if not self.config_path.is_file():
-            sys.exit(FileNotFoundError(f"File '{self.config_path}' not found in project directory."))
-
-        with self.config_path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        data = self.config_path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
 
     def _setup_paths(self):
         """
@@ -46,7 +62,7 @@ class AppConfig:
         logs_dir = self._paths.get("logs_dir", default_logs)
         logs_dir.mkdir(parents=True, exist_ok=True)  # <-- ensure logs directory exists, if not, create it
 
-        logging.config.dictConfig(logger_cfg)
+        _configure_once(logger_cfg)
 
     @property
     def paths(self) -> dict[str, Path]:
@@ -71,5 +87,5 @@ class AppConfig:
         Return absolute path for the given directory key.
         """
         if dir_name not in self._paths:
-            sys.exit(KeyError(f"'{dir_name}' is not in configuration file!"))
+            raise KeyError(dir_name)
         return self._paths[dir_name]
@@ -1,8 +1,44 @@
 import json
 import logging.config
+import os
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_CONFIGURED = False
+_CONFIGURED_LOCK = threading.Lock()
+
+
+def _configure_once(logging_config: dict) -> None:
+    """Run dictConfig only on the first call in this process."""
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    with _CONFIGURED_LOCK:
+        if not _CONFIGURED:
+            logging.config.dictConfig(logging_config)
+            _CONFIGURED = True
+
+
+def _create_dirs(paths: list[Path]) -> None:
+    """mkdir each missing directory (and missing ancestor) exactly once, parents first."""
+    missing: set[Path] = set()
+    for path in set(paths):
+        while path not in missing and not path.is_dir():
+            missing.add(path)
+            path = path.parent
+    for path in sorted(missing, key=lambda p: len(p.parts)):
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not path.is_dir():
+                raise
+
 
 class AppConfig:
     """
@@ -23,17 +59,14 @@ class AppConfig:
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file using json.load for efficiency."""
-        if not self.config_path.is_file():
-            raise FileNotFoundError(f"Config not found: {self.config_path}")
-        with self.config_path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        data = self.config_path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
 
     def _setup_paths(self) -> Dict[str, Path]:
         paths: Dict[str, Path] = {}
         for name, rel_path in self._config.get("paths", {}).items():
-            path = self.base_dir / rel_path
-            path.mkdir(parents=True, exist_ok=True)
-            paths[name] = path
+            paths[name] = self.base_dir / rel_path
+        _create_dirs(list(paths.values()))
         return paths
 
     def _setup_logging(self) -> None:
@@ -42,7 +75,7 @@ class AppConfig:
         logs_dir = self._paths.get("logs_dir", default_logs)
         logs_dir.mkdir(parents=True, exist_ok=True)
 
-        logging.config.dictConfig(log_cfg)
+        _configure_once(log_cfg)
 
     @property
     def app_name(self) -> str:
@@ -5,13 +5,37 @@ Provides centralized configuration management using a Singleton pattern,
 Pydantic validation, and dynamic logging configuration for the application.
 """
 
+import errno
+import hashlib
 import json
 import logging.config
-from pathlib import Path
+import mmap
+import os
+import pickle  # nosec B403 - only reads the sidecar cache written below
+import stat
+import tempfile
+import threading
 from functools import lru_cache
+from pathlib import Path
 
+import pydantic
 from pydantic import BaseModel, BaseSettings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
 __all__ = ["get_app_config"]
 
 
@@ -63,6 +87,204 @@ class AppConfigSchema(BaseSettings):
         env_file_encoding = "utf-8"
 
 
+# ----------------------------
+# JSON Reading
+# ----------------------------
+
+_MMAP_MIN_SIZE = 4096
+_STREAM_MIN_SIZE = 1 << 20
+
+
+def _read_json(path: Path, size: int) -> dict:
+    """
+    Parse a JSON settings file, preferring orjson.
+
+    Files of at least ``_MMAP_MIN_SIZE`` bytes are memory-mapped and handed to orjson
+    as a buffer, skipping the copy into a bytes object. Without orjson, files over
+    ``_STREAM_MIN_SIZE`` are parsed incrementally with ijson (if installed) rather
+    than read into memory first. Smaller files are read in one go, where the mmap
+    setup would cost more than the copy. The whole document is always returned, so
+    validation sees (and rejects) unknown keys the same way on every path.
+    """
+    if orjson is None:
+        if ijson is not None and size > _STREAM_MIN_SIZE:
+            with path.open("rb") as file:
+                return next(ijson.items(file, "", use_float=True))
+        return json.loads(path.read_bytes())
+    if size < _MMAP_MIN_SIZE:
+        return orjson.loads(path.read_bytes())
+    with path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+# ----------------------------
+# Parsed Settings Cache
+# ----------------------------
+
+def _config_cache_path(config_path: Path) -> Path:
+    return config_path.with_name(config_path.name + ".cache")
+
+
+@lru_cache(maxsize=None)
+def _schema_fingerprint() -> str:
+    """Digest of the schema and pydantic version; cached values are only trusted for the same pair."""
+    schema = f"{pydantic.VERSION}:{AppConfigSchema.schema_json()}"
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()
+
+
+def _config_cache_key(config_path: Path, st: os.stat_result) -> bytes:
+    """
+    Return a 64-byte digest of everything the validated config depends on.
+
+    That is the settings file's path, mtime and size, the ``.env`` file and any
+    environment variables that BaseSettings would apply as overrides, and the schema
+    itself (a cache hit skips validation, so it must not outlive a schema change).
+    """
+    try:
+        env_st = Path(AppConfigSchema.Config.env_file).stat()
+        env_file = f"{env_st.st_mtime_ns}:{env_st.st_size}"
+    except OSError:
+        env_file = "-"
+    overrides = sorted((k, v) for k, v in os.environ.items() if k.lower() in AppConfigSchema.__fields__)
+    key = f"{config_path}:{st.st_mtime_ns}:{st.st_size}:{env_file}:{overrides}:{_schema_fingerprint()}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest().encode("ascii")
+
+
+def _construct_schema(validated: dict) -> AppConfigSchema:
+    """Rebuild an AppConfigSchema from previously validated values without re-validating."""
+    return AppConfigSchema.construct(
+        app=AppMetadata.construct(**validated["app"]),
+        paths=AppPaths.construct(**validated["paths"]),
+        logging=LoggingConfig.construct(**validated["logging"]),
+    )
+
+
+def _read_config_cache(cache_path: Path, key: bytes) -> dict | None:
+    """Return the cached validated config if the sidecar was written for ``key``."""
+    try:
+        blob = cache_path.read_bytes()
+    except OSError:
+        return None
+    if blob[: len(key)] != key:
+        return None
+    try:
+        return pickle.loads(blob[len(key) :])  # nosec B301
+    except Exception:
+        return None
+
+
+def _write_config_cache(cache_path: Path, key: bytes, validated: dict) -> None:
+    """Atomically replace the sidecar; failures only cost a re-parse next time."""
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name)
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(key)
+            pickle.dump(validated, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+# ----------------------------
+# Directory Setup
+# ----------------------------
+
+def _create_dirs(paths: list[Path]) -> None:
+    """
+    Create all directories in ``paths``, issuing one mkdir per missing directory.
+
+    Ancestors shared between paths are only checked and created once, parents first.
+    When liburing is installed, directories at the same depth are independent and
+    are created as one io_uring batch.
+    """
+    missing: set[Path] = set()
+    for path in set(paths):
+        while path not in missing and not path.is_dir():
+            missing.add(path)
+            path = path.parent
+
+    by_depth: dict[int, list[Path]] = {}
+    for path in missing:
+        by_depth.setdefault(len(path.parts), []).append(path)
+
+    for depth in sorted(by_depth):
+        siblings = by_depth[depth]
+        if liburing is not None and len(siblings) > 1 and _mkdir_batch(siblings):
+            continue
+        for path in siblings:
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                if not path.is_dir():
+                    raise
+
+
+def _mkdir_batch(paths: list[Path]) -> bool:
+    """
+    Create same-depth directories with a single io_uring submission.
+
+    Returns False if a ring cannot be set up (e.g. io_uring disabled), in which
+    case nothing was submitted and the caller should fall back to os.mkdir.
+    """
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    try:
+        liburing.io_uring_queue_init(len(paths), ring)
+    except OSError:
+        return False
+    try:
+        for index, path in enumerate(paths):
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_mkdir(sqe, str(path), 0o777)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+        liburing.io_uring_submit(ring)
+
+        for _ in paths:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            path = paths[entry.user_data]
+            try:
+                entry.res  # raises the matching OSError for a failed mkdir
+            except FileExistsError:
+                if not path.is_dir():
+                    raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(path)) from None
+            except OSError as e:
+                raise type(e)(e.errno, e.strerror, str(path)) from None
+            finally:
+                liburing.io_uring_cq_advance(ring, 1)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return True
+
+
+# ----------------------------
+# Logging Setup
+# ----------------------------
+
+_CONFIGURED = False
+_CONFIGURED_LOCK = threading.Lock()
+
+
+def _configure_once(logging_config: dict) -> None:
+    """
+    Apply ``logging_config`` with dictConfig the first time it is called.
+
+    dictConfig walks and resets every existing logger, so running it on each
+    AppConfig construction is wasted work; later calls are no-ops.
+    """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    with _CONFIGURED_LOCK:
+        if not _CONFIGURED:
+            logging.config.dictConfig(logging_config)
+            _CONFIGURED = True
+
+
 # ----------------------------
 # AppConfig Singleton
 # ----------------------------
@@ -76,53 +298,75 @@ class AppConfig:
     access to application metadata and directories.
     """
 
-    def __init__(self, config_file_path: Path | None = None):
+    def __init__(self, config_file_path: Path | None = None, resolve_symlinks: bool = False):
         self.project_root = Path(__file__).resolve().parents[1]
         self.config_file_path = config_file_path or self.project_root / "settings.json"
-
-        if not self.config_file_path.is_file():
-            raise ConfigFileNotFoundError(f"Missing configuration file: {self.config_file_path}")
+        self.resolve_symlinks = resolve_symlinks
 
         self._config = self._load_config()
-        self._absolute_paths = self._resolve_and_create_paths()
-        self._inject_log_file_path()
-        self.logger = self._configure_logging()
+        self._absolute_paths, self.logger = self._materialize()
 
     def _load_config(self) -> AppConfigSchema:
-        """Load and validate JSON-based config, allowing for .env overrides."""
-        with self.config_file_path.open("r", encoding="utf-8") as file:
-            raw_config = json.load(file)
-        return AppConfigSchema(**raw_config)
+        """
+        Load and validate JSON-based config, allowing for .env overrides.
+
+        The file is stat'ed once; a missing path or non-regular file raises
+        ConfigFileNotFoundError.
 
-    def _resolve_and_create_paths(self) -> dict[str, Path]:
+        The validated config is cached in a ``settings.json.cache`` sidecar keyed on the
+        file's path, mtime and size (and the .env overrides), so unchanged settings skip
+        both the JSON parser and Pydantic validation.
         """
-        Resolve relative paths to absolute paths from project root.
+        try:
+            st = self.config_file_path.stat()
+        except FileNotFoundError:
+            raise ConfigFileNotFoundError(f"Missing configuration file: {self.config_file_path}") from None
+        if not stat.S_ISREG(st.st_mode):
+            raise ConfigFileNotFoundError(f"Missing configuration file: {self.config_file_path}")
+
+        cache_path = _config_cache_path(self.config_file_path)
+        key = _config_cache_key(self.config_file_path, st)
+        cached = _read_config_cache(cache_path, key)
+        if cached is not None:
+            return _construct_schema(cached)
+
+        config = AppConfigSchema(**_read_json(self.config_file_path, st.st_size))
+        _write_config_cache(cache_path, key, config.dict())
+        return config
+
+    def _materialize(self) -> tuple[dict[str, Path], logging.Logger]:
+        """
+        Turn the loaded config into runtime state in a single pass.
+
+        Resolves relative paths against the project root and creates the directories,
+        points the file log handler at ``logs_dir``, and configures logging (once per
+        process) straight from the config's logging dict, without a ``.dict()`` copy.
+
+        Relative paths are normalized lexically; symlinks are only resolved (one
+        ``realpath`` walk per path) when ``resolve_symlinks`` was requested.
 
         Returns:
-            dict[str, Path]: Resolved and auto-created directory paths.
+            tuple[dict[str, Path], logging.Logger]: Resolved directory paths and the app logger.
         """
         resolved_paths = {}
-        for key, val in self._config.paths.dict().items():
+        for key, val in self._config.paths:
             path = Path(val).expanduser()
             if not path.is_absolute():
-                path = (self.project_root / path).resolve()
-            path.mkdir(parents=True, exist_ok=True)
+                path = self.project_root / path
+                path = path.resolve() if self.resolve_symlinks else Path(os.path.normpath(path))
             resolved_paths[key] = path
-        return resolved_paths
+        _create_dirs(list(resolved_paths.values()))
 
-    def _inject_log_file_path(self) -> None:
-        """Inject resolved log file path into logging config before setup."""
-        log_file = self._absolute_paths["logs_dir"] / "diamond_parser.log"
-        handler = self._config.logging.handlers.get("file")
+        logging_config = dict(self._config.logging)
+        handler = logging_config["handlers"].get("file")
         if handler and "filename" in handler:
-            handler["filename"] = str(log_file)
+            handler["filename"] = str(resolved_paths["logs_dir"] / "diamond_parser.log")
+        _configure_once(logging_config)
 
-    def _configure_logging(self) -> logging.Logger:
-        """Configure logging using the logging dictConfig."""
-        logging.config.dictConfig(self._config.logging.dict())
         logger = logging.getLogger(self.app_name)
-        logger.info("Logger initialized.")
-        return logger
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Logger initialized.")
+        return resolved_paths, logger
 
     @property
     def paths(self) -> dict[str, Path]:
@@ -160,14 +404,24 @@ class AppConfig:
 # Singleton Accessor
 # ----------------------------
 
-@lru_cache(maxsize=1)
+_instance: AppConfig | None = None
+_instance_lock = threading.Lock()
+
+
 def get_app_config() -> AppConfig:
     """
     Returns the singleton instance of AppConfig.
 
-    Ensures config is loaded only once during app lifetime.
+    Ensures config is loaded only once during app lifetime. The lock is only taken
+    until the instance exists; after that a call is a single global read.
     """
-    return AppConfig()
+    global _instance
+    if _instance is not None:
+        return _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = AppConfig()
+    return _instance
 
 
 
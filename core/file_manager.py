@@ -27,14 +27,333 @@ Example:
 
 Dependencies:
     json, pathlib, typing, config.app_config.AppConfig
+    orjson (optional, used for JSON when installed)
+    liburing (optional, batches load_files/save_files I/O through io_uring)
 """
 
+import io
 import json
+import math
+import mmap
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, ClassVar, Protocol, Type
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, ClassVar, Iterator, Mapping, Protocol, Type
 
 from config.app_config import AppConfig
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+WRITE_BUFFER_SIZE = 1 << 20
+# O_DIRECT reads are opt-in: they bypass the page cache, which only helps cold,
+# read-once files and makes every warm read go to the device.
+DIRECT_READS = False
+DIRECT_READ_MIN_SIZE = 2 << 20
+MMAP_READ_MIN_SIZE = 16 << 20
+STREAMING_MIN_SIZE = 8 << 20
+_DIRECT_ALIGN = 4096
+_O_DIRECT = getattr(os, "O_DIRECT", 0)
+URING_BATCH_SIZE = 256
+_ESTIMATE_SAMPLE = 8
+
+# Shared stdlib encoder for when orjson is missing. Output is UTF-8 like orjson's;
+# circular references surface as RecursionError instead of being checked for up front.
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, check_circular=False)
+
+
+def _orjson_loads(data: bytes | bytearray | memoryview) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # json also accepts the NaN/Infinity literals it writes; orjson rejects them.
+        return json.loads(bytes(data))
+
+
+def _has_non_finite(data: Any) -> bool:
+    """True if ``data`` contains a NaN or infinite float anywhere (orjson writes those as null)."""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _estimate_size(data: Any, depth: int = 3) -> int:
+    """
+    Rough in-memory size of ``data``, including nested containers.
+
+    Each container's items are estimated from a sample of its first few, scaled up
+    to its length, down to ``depth`` levels, so the cost does not grow with the data.
+    """
+    size = sys.getsizeof(data)
+    if depth and data and isinstance(data, (dict, list, tuple)):
+        items = data.values() if isinstance(data, dict) else data
+        sample = [_estimate_size(item, depth - 1) for item in islice(items, _ESTIMATE_SAMPLE)]
+        size += sum(sample) * len(data) // len(sample)
+    return size
+
+
+def _read_file(filepath: Path) -> bytes:
+    """
+    Read a whole file in one go.
+
+    With DIRECT_READS set, files of at least DIRECT_READ_MIN_SIZE are read with
+    O_DIRECT where the platform supports it, so a cold, read-once file does not
+    evict other data from the page cache (the result is still copied out of the
+    aligned buffer). Filesystems that reject O_DIRECT (e.g. tmpfs) fall back to a
+    plain read.
+    """
+    with open(filepath, "rb", buffering=0) as f:
+        return _read_open(f, os.fstat(f.fileno()).st_size)
+
+
+def _read_open(f: io.FileIO, size: int) -> bytes:
+    """Read the rest of an unbuffered file of ``size`` bytes; see ``_read_file``."""
+    if DIRECT_READS and size >= DIRECT_READ_MIN_SIZE and _O_DIRECT and fcntl is not None:
+        data = _read_direct(f.fileno(), size)
+        if data is not None:
+            return data
+    return f.readall()
+
+
+def _read_direct(fd: int, size: int) -> bytes | None:
+    """Read ``size`` bytes from ``fd`` with O_DIRECT, or return None if that is not possible."""
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    try:
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags | _O_DIRECT)
+    except OSError:
+        return None
+    try:
+        # Anonymous mmaps are page-aligned, as O_DIRECT requires of the buffer.
+        with mmap.mmap(-1, -(-size // _DIRECT_ALIGN) * _DIRECT_ALIGN) as buf:
+            try:
+                read = os.preadv(fd, [buf], 0)
+            except OSError:
+                return None
+            return buf[:size] if read == size else None
+    finally:
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags)
+
+
+@contextmanager
+def _open_write(filepath: Path, excl: bool = False, buffering: int = WRITE_BUFFER_SIZE) -> Iterator[BinaryIO]:
+    """
+    Open ``filepath`` for binary writing with a ``buffering``-byte buffer (1 MiB by default, 0 for none).
+
+    With ``excl`` the file is created with O_EXCL, so an existing file raises
+    FileExistsError from the open itself (no separate exists() check to race with);
+    a file created this way is removed again if the write fails.
+    """
+    if not excl:
+        with open(filepath, "wb", buffering=buffering) as f:
+            yield f
+        return
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb", buffering=buffering) as f:
+            yield f
+    except BaseException:
+        filepath.unlink(missing_ok=True)
+        raise
+
+
+def _write_bytes(filepath: Path, payload: bytes, durable: bool = False, excl: bool = False) -> None:
+    """
+    Write an already-encoded ``payload`` straight to an unbuffered binary file.
+
+    The whole payload is in memory, so a write buffer would only be allocated and then
+    bypassed; binary mode skips the TextIOWrapper layer. ``durable`` fsyncs before closing.
+    """
+    with _open_write(filepath, excl, buffering=0) as f:
+        written = 0
+        while written < len(payload):  # a raw write may be partial
+            written += f.write(payload[written:])
+        if durable:
+            os.fsync(f.fileno())
+
+
+def _write_fp(fp: BinaryIO, payload: bytes, durable: bool = False) -> None:
+    fp.write(payload)
+    if durable:
+        fp.flush()
+        os.fsync(fp.fileno())
+
+
+def _read_batch(filepaths: list[Path]) -> list[bytearray] | None:
+    """
+    Read whole files through io_uring, submitting up to URING_BATCH_SIZE reads at a time.
+
+    Returns the contents in ``filepaths`` order, or None if a ring cannot be set up
+    (io_uring unavailable), in which case the caller should read the files itself.
+    Each chunk's files are closed before the next chunk is opened, so a large batch
+    never holds more than URING_BATCH_SIZE descriptors.
+    """
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    try:
+        liburing.io_uring_queue_init(min(len(filepaths), URING_BATCH_SIZE), ring)
+    except OSError:
+        return None
+
+    buffers: list[bytearray] = []
+    try:
+        for offset in range(0, len(filepaths), URING_BATCH_SIZE):
+            chunk = filepaths[offset : offset + URING_BATCH_SIZE]
+            buffers.extend(_read_chunk(ring, cqe, chunk))
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return buffers
+
+
+def _read_chunk(ring: Any, cqe: Any, filepaths: list[Path]) -> list[bytearray]:
+    fds: list[int] = []
+    buffers: list[bytearray] = []
+    try:
+        for index, filepath in enumerate(filepaths):
+            fd = os.open(filepath, os.O_RDONLY)
+            fds.append(fd)
+            buffers.append(bytearray(os.fstat(fd).st_size))
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, fd, buffers[index], 0)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+        submitted = liburing.io_uring_submit(ring) if fds else 0
+
+        sizes = [0] * len(filepaths)
+        error: OSError | None = None
+        for _ in range(submitted):
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            index = entry.user_data
+            try:
+                sizes[index] = entry.res  # raises the matching OSError for a failed read
+            except OSError as e:
+                error = error or type(e)(e.errno, e.strerror, str(filepaths[index]))
+            finally:
+                liburing.io_uring_cq_advance(ring, 1)
+        if error is not None:
+            raise error
+
+        # A short read is legal; finish those files synchronously.
+        for fd, buf, size in zip(fds, buffers, sizes):
+            while size < len(buf):
+                data = os.pread(fd, len(buf) - size, size)
+                if not data:
+                    del buf[size:]
+                    break
+                buf[size : size + len(data)] = data
+                size += len(data)
+    finally:
+        for fd in fds:
+            os.close(fd)
+    return buffers
+
+
+def _write_batch(filepaths: list[Path], payloads: list[bytes], durable: bool = False) -> bool:
+    """
+    Write each payload to its file through io_uring, up to URING_BATCH_SIZE files at a time.
+
+    Returns False without touching any file if a ring cannot be set up, in which case
+    the caller should write the files itself.
+    """
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    try:
+        liburing.io_uring_queue_init(min(len(filepaths), URING_BATCH_SIZE), ring)
+    except OSError:
+        return False
+
+    try:
+        for offset in range(0, len(filepaths), URING_BATCH_SIZE):
+            end = offset + URING_BATCH_SIZE
+            _write_chunk(ring, cqe, filepaths[offset:end], payloads[offset:end], durable)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return True
+
+
+def _write_chunk(ring: Any, cqe: Any, filepaths: list[Path], payloads: list[bytes], durable: bool) -> None:
+    # Open every target before writing to any, and without O_TRUNC: if one open
+    # fails, existing files are left as they were. Each file is cut to its new length
+    # only once its write is done. If anything fails, the files created here are
+    # removed again; existing files whose writes succeeded still end up complete.
+    fds: list[int] = []
+    created: list[Path] = []
+    try:
+        for filepath in filepaths:
+            try:
+                fds.append(os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+                created.append(filepath)
+            except FileExistsError:
+                fds.append(os.open(filepath, os.O_WRONLY))
+
+        for index, (fd, payload) in enumerate(zip(fds, payloads)):
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_write(sqe, fd, payload, 0)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+        submitted = liburing.io_uring_submit(ring) if fds else 0
+
+        written: list[int | None] = [0] * len(filepaths)
+        error: OSError | None = None
+        for _ in range(submitted):
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            index = entry.user_data
+            try:
+                written[index] = entry.res  # raises the matching OSError for a failed write
+            except OSError as e:
+                written[index] = None
+                error = error or type(e)(e.errno, e.strerror, str(filepaths[index]))
+            finally:
+                liburing.io_uring_cq_advance(ring, 1)
+
+        # Finish short writes and drop any stale tail for every write that succeeded,
+        # even if another one in the chunk failed.
+        for filepath, fd, payload, done in zip(filepaths, fds, payloads, written):
+            if done is None:
+                continue
+            try:
+                while done < len(payload):
+                    done += os.pwrite(fd, payload[done:], done)
+                os.ftruncate(fd, len(payload))
+                if durable:
+                    os.fsync(fd)
+            except OSError as e:
+                error = error or type(e)(e.errno, e.strerror, str(filepath))
+        if error is not None:
+            raise error
+    except BaseException:
+        for filepath in created:
+            filepath.unlink(missing_ok=True)
+        raise
+    finally:
+        for fd in fds:
+            os.close(fd)
+
 
 class FileHandler(Protocol):
     """
@@ -46,7 +365,18 @@ class FileHandler(Protocol):
     def load(cls, filepath: Path) -> str | dict[str, Any]: ...
 
     @classmethod
-    def save(cls, data: str | dict[str, Any], filepath: Path) -> None: ...
+    def decode(cls, data: bytes | bytearray) -> str | dict[str, Any]: ...
+
+    @classmethod
+    def encode(cls, data: str | dict[str, Any]) -> bytes: ...
+
+    @classmethod
+    def save(
+        cls, data: str | dict[str, Any], filepath: Path, durable: bool = False, *, excl: bool = False
+    ) -> None: ...
+
+    @classmethod
+    def save_to_fp(cls, data: str | dict[str, Any], fp: BinaryIO, durable: bool = False) -> None: ...
 
 
 class JSONFileHandler(FileHandler):
@@ -56,15 +386,82 @@ class JSONFileHandler(FileHandler):
 
     @classmethod
     def load(cls, filepath: Path) -> dict[str, Any]:
-        with filepath.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        # One read() of the whole file; both parsers accept UTF-8 bytes directly.
+        if orjson is None:
+            return cls.decode(_read_file(filepath))
+        with open(filepath, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            # Very large files are parsed straight out of the page cache via mmap (no
+            # copy into a bytes object); that is the better choice when the cache is
+            # warm. Opt-in O_DIRECT (in _read_open) only pays off for cold, one-shot reads.
+            if size >= MMAP_READ_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return _orjson_loads(view)
+            return _orjson_loads(_read_open(f, size))
+
+    @classmethod
+    def decode(cls, data: bytes | bytearray) -> dict[str, Any]:
+        return _orjson_loads(data) if orjson is not None else json.loads(data)
+
+    @classmethod
+    def save(
+        cls,
+        data: str | dict[str, Any],
+        filepath: Path,
+        durable: bool = False,
+        streaming: bool | None = None,
+        *,
+        excl: bool = False,
+    ) -> None:
+        # Check before opening: opening truncates an existing file.
+        if not isinstance(data, dict):
+            raise TypeError("JSONFileHandler.save expects a dict")
+        with _open_write(filepath, excl) as f:
+            cls.save_to_fp(data, f, durable, streaming)
 
     @classmethod
-    def save(cls, data: str | dict[str, Any], filepath: Path) -> None:
+    def save_to_fp(
+        cls, data: str | dict[str, Any], fp: BinaryIO, durable: bool = False, streaming: bool | None = None
+    ) -> None:
+        """
+        Encode ``data`` into ``fp``.
+
+        ``streaming=None`` streams only without orjson, for documents whose estimated
+        in-memory size (nested data included, e.g. a dict of large arrays) exceeds
+        STREAMING_MIN_SIZE; orjson encodes even large documents faster in one call.
+        """
         if not isinstance(data, dict):
             raise TypeError("JSONFileHandler.save expects a dict")
-        with filepath.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        if streaming is None:
+            streaming = orjson is None and _estimate_size(data) > STREAMING_MIN_SIZE
+        if streaming:
+            cls._stream(data, fp, durable)
+        else:
+            _write_fp(fp, cls.encode(data), durable)
+
+    @staticmethod
+    def _stream(data: dict[str, Any], fp: BinaryIO, durable: bool) -> None:
+        # Only the current chunk of output is held in memory, not the full document.
+        for chunk in _JSON_ENCODER.iterencode(data):
+            fp.write(chunk.encode("utf-8"))
+        _write_fp(fp, b"\n", durable)
+
+    @classmethod
+    def encode(cls, data: str | dict[str, Any]) -> bytes:
+        if not isinstance(data, dict):
+            raise TypeError("JSONFileHandler.save expects a dict")
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+                )
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; json handles them
+            else:
+                # orjson writes NaN/Infinity as null; only look for them when a null was written.
+                if b"null" not in payload or not _has_non_finite(data):
+                    return payload
+        return (_JSON_ENCODER.encode(data) + "\n").encode("utf-8")
 
 
 class TextFileHandler(FileHandler):
@@ -74,13 +471,75 @@ class TextFileHandler(FileHandler):
 
     @classmethod
     def load(cls, filepath: Path) -> str:
-        return filepath.read_text(encoding="utf-8")
+        return cls.decode(_read_file(filepath))
+
+    @classmethod
+    def decode(cls, data: bytes | bytearray) -> str:
+        text = data.decode("utf-8", errors="strict")
+        # same universal-newline translation read_text applies
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    @classmethod
+    def save(
+        cls, data: str | dict[str, Any], filepath: Path, durable: bool = False, *, excl: bool = False
+    ) -> None:
+        _write_bytes(filepath, cls.encode(data), durable, excl)
+
+    @classmethod
+    def save_to_fp(cls, data: str | dict[str, Any], fp: BinaryIO, durable: bool = False) -> None:
+        _write_fp(fp, cls.encode(data), durable)
 
     @classmethod
-    def save(cls, data: str | dict[str, Any], filepath: Path) -> None:
+    def encode(cls, data: str | dict[str, Any]) -> bytes:
         if not isinstance(data, str):
             raise TypeError("TextFileHandler.save expects a str")
-        filepath.write_text(data, encoding="utf-8")
+        return data.encode("utf-8")
+
+
+# The supported file types. FileManager's dispatch is all derived from this table,
+# so supporting another type only takes an entry here.
+_HANDLERS: dict[str, Type[FileHandler]] = {
+    ".json": JSONFileHandler,
+    ".txt": TextFileHandler,
+}
+
+Loader = Callable[[Path], str | dict[str, Any]]
+Saver = Callable[..., None]
+
+# Suffix -> (load, save), resolved once at import so the hot paths call the handlers'
+# methods directly instead of looking them up on the class for every call.
+_DISPATCH: dict[str, tuple[Loader, Saver]] = {ext: (h.load, h.save) for ext, h in _HANDLERS.items()}
+
+
+@lru_cache(maxsize=128)
+def _load_cached(filepath: str, mtime_ns: int, size: int, load: Loader) -> str | Mapping[str, Any]:
+    """
+    Load and memoize a file. mtime/size are part of the key, so a changed file misses.
+
+    Every caller shares the cached object, so it is frozen all the way down (see
+    ``_freeze``).
+    """
+    return _freeze(load(Path(filepath)))
+
+
+def _freeze(data: Any) -> Any:
+    """Deep read-only copy of parsed JSON: dicts become read-only mappings, lists tuples."""
+    if isinstance(data, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(_freeze(item) for item in data)
+    return data
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedTarget:
+    """A resolved file path and its handler's load/save, from ``FileManager.prepare``."""
+
+    path: Path
+    load: Loader
+    save: Saver
 
 
 class FileManager:
@@ -89,56 +548,218 @@ class FileManager:
     Supports logging and overwrite control.
     """
 
-    _handlers: ClassVar[dict[str, Type[FileHandler]]] = {
-        ".json": JSONFileHandler,
-        ".txt": TextFileHandler,
-    }
+    # Supported extensions, for introspection and error messages.
+    _handlers: ClassVar[dict[str, Type[FileHandler]]] = _HANDLERS
+    _supported_msg: ClassVar[str] = ", ".join(_handlers)
 
     def __init__(self, config: AppConfig):
         self.config = config
         self.logger = config.logger
+        self._dirs: dict[str, Path] = dict(config.paths)
+        self._loaders: dict[tuple[str, str], Callable[[str], str | dict[str, Any]]] = {}
+
+    def _filepath(self, dir_key: str, filename: str) -> Path:
+        base_dir = self._dirs.get(dir_key)
+        if base_dir is None:
+            base_dir = self.config.get_path(dir_key)  # raises for unknown keys
+        return base_dir / filename
 
     def _to_path(self, filename: str | Path) -> Path:
         return filename if isinstance(filename, Path) else Path(filename)
 
-    def _get_handler(self, filepath: Path) -> Type[FileHandler]:
-        ext = filepath.suffix.lower()
-        handler = self._handlers.get(ext)
-        if not handler:
-            supported = ", ".join(self._handlers.keys())
-            raise ValueError(f"Unsupported file type: {ext!r}. Supported: {supported}")
-        return handler
+    def _get_handler(self, filepath: Path) -> tuple[Loader, Saver]:
+        return self._dispatch(filepath.suffix)
+
+    @classmethod
+    def _dispatch(cls, suffix: str) -> tuple[Loader, Saver]:
+        try:
+            return _DISPATCH[suffix.lower()]
+        except KeyError:
+            raise cls._unsupported(suffix) from None
+
+    @classmethod
+    def _get_codec(cls, filepath: Path) -> Type[FileHandler]:
+        """The handler class itself, for the encode/decode halves used by batched I/O."""
+        try:
+            return _HANDLERS[filepath.suffix.lower()]
+        except KeyError:
+            raise cls._unsupported(filepath.suffix) from None
+
+    @classmethod
+    def _unsupported(cls, suffix: str) -> ValueError:
+        return ValueError(f"Unsupported file type: {suffix.lower()!r}. Supported: {cls._supported_msg}")
+
+    def prepare(self, dir_key: str, filename: str) -> _PreparedTarget:
+        """
+        Resolve a file's path and handler once, for repeated ``load_prepared`` /
+        ``save_prepared`` calls on the same file.
+        """
+        filepath = self._filepath(dir_key, filename)
+        return _PreparedTarget(filepath, *self._get_handler(filepath))
+
+    def loader(self, dir_key: str, ext: str) -> Callable[[str], str | dict[str, Any]]:
+        """
+        Return a ``load(filename)`` function bound to one directory and extension.
+
+        The directory and handler are resolved once (and the function memoized), so a
+        loop over many files skips that work per call. Filenames are expected to carry
+        ``ext``. Errors are raised as IOError like ``load_file``, but successful loads
+        are not logged individually.
+        """
+        key = (dir_key, ext.lower())
+        load = self._loaders.get(key)
+        if load is None:
+            load = self._loaders[key] = self._make_loader(*key)
+        return load
+
+    def _make_loader(self, dir_key: str, ext: str) -> Callable[[str], str | dict[str, Any]]:
+        base_dir = self._filepath(dir_key, "")
+        handler_load, _ = self._dispatch(ext)
+        logger = self.logger
+
+        def load(filename: str) -> str | dict[str, Any]:
+            filepath = base_dir / filename
+            try:
+                return handler_load(filepath)
+            except Exception as e:
+                logger.error("Failed to load file %s: %s", filepath, e)
+                raise IOError(f"Failed to load {filepath}: {e}") from e
+
+        return load
 
     def load_file(self, dir_key: str, filename: str) -> str | dict[str, Any]:
-        base_dir = self.config.get_path(dir_key)
-        filepath = base_dir / filename
-        handler = self._get_handler(filepath)
+        return self.load_prepared(self.prepare(dir_key, filename))
+
+    def load_prepared(self, target: _PreparedTarget) -> str | dict[str, Any]:
+        filepath = target.path
         try:
-            data = handler.load(filepath)
-            self.logger.info(f"Loaded file: {filepath}")
+            data = target.load(filepath)
+            self.logger.info("Loaded file: %s", filepath)
             return data
         except Exception as e:
-            self.logger.error(f"Failed to load file {filepath}: {e}")
+            self.logger.error("Failed to load file %s: %s", filepath, e)
+            raise IOError(f"Failed to load {filepath}: {e}") from e
+
+    def load_cached(self, dir_key: str, filename: str) -> str | Mapping[str, Any]:
+        """
+        Load a file like ``load_file``, memoizing the result on (path, mtime, size).
+
+        Repeated loads of an unchanged file skip both the read and the parse. The
+        object is shared, so JSON results are read-only throughout: nested objects
+        are read-only mappings and arrays are tuples.
+        """
+        filepath = self._filepath(dir_key, filename)
+        load, _ = self._get_handler(filepath)
+        try:
+            st = filepath.stat()
+            return _load_cached(str(filepath), st.st_mtime_ns, st.st_size, load)
+        except Exception as e:
+            self.logger.error("Failed to load file %s: %s", filepath, e)
             raise IOError(f"Failed to load {filepath}: {e}") from e
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop everything memoized by ``load_cached``."""
+        _load_cached.cache_clear()
+
+    def load_files(self, items: list[tuple[str, str]]) -> list[str | dict[str, Any]]:
+        """
+        Load several ``(dir_key, filename)`` files, returning their contents in order.
+
+        With liburing installed, all reads go to the kernel as one io_uring batch and
+        each buffer is then decoded by its handler. Otherwise, or if io_uring is not
+        available, the files are loaded concurrently with ``load_many``.
+        """
+        filepaths = [self._filepath(dir_key, filename) for dir_key, filename in items]
+        handlers = [self._get_codec(filepath) for filepath in filepaths]
+
+        if liburing is not None and len(filepaths) > 1:
+            try:
+                contents = _read_batch(filepaths)
+            except Exception as e:
+                self.logger.error("Failed to batch load files: %s", e)
+                raise IOError(f"Failed to batch load files: {e}") from e
+            if contents is not None:
+                results = []
+                for filepath, handler, data in zip(filepaths, handlers, contents):
+                    try:
+                        results.append(handler.decode(data))
+                    except Exception as e:
+                        self.logger.error("Failed to load file %s: %s", filepath, e)
+                        raise IOError(f"Failed to load {filepath}: {e}") from e
+                self.logger.info("Loaded %d files in one batch", len(results))
+                return results
+
+        return self.load_many(items)
+
+    def load_many(self, items: list[tuple[str, str]], workers: int = 8) -> list[str | dict[str, Any]]:
+        """
+        Load several ``(dir_key, filename)`` files with ``load_file`` on a thread pool.
+
+        File reads release the GIL, so the threads overlap their I/O waits. Results are
+        returned in order; the first failure is raised as in ``load_file``.
+        """
+        if len(items) <= 1:
+            return [self.load_file(dir_key, filename) for dir_key, filename in items]
+        with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+            return list(executor.map(lambda item: self.load_file(*item), items))
+
+    def save_files(self, items: list[tuple[str | dict[str, Any], str, str]], durable: bool = False) -> None:
+        """
+        Save several ``(data, dir_key, filename)`` items, overwriting existing files.
+
+        With liburing installed, every payload is encoded up front and the writes go to
+        the kernel as io_uring batches of up to URING_BATCH_SIZE files; no file in a
+        batch is modified unless all of its targets could be opened. Otherwise, or if
+        io_uring is not available, the files are saved one at a time with ``save_file``.
+        """
+        filepaths = [self._filepath(dir_key, filename) for _, dir_key, filename in items]
+        handlers = [self._get_codec(filepath) for filepath in filepaths]
+
+        if liburing is not None and len(filepaths) > 1:
+            try:
+                # Batched writes to one path would race; keep the last payload per path,
+                # which is what saving the items in order leaves behind.
+                payloads: dict[Path, bytes] = {}
+                for filepath, handler, (data, _, _) in zip(filepaths, handlers, items):
+                    payloads[filepath] = handler.encode(data)
+                written = _write_batch(list(payloads), list(payloads.values()), durable)
+            except Exception as e:
+                self.logger.error("Failed to batch save files: %s", e)
+                raise IOError(f"Failed to batch save files: {e}") from e
+            if written:
+                self.logger.info("Saved %d files in one batch", len(payloads))
+                return
+
+        for data, dir_key, filename in items:
+            self.save_file(data, dir_key, filename, durable=durable)
+
     def save_file(
         self,
         data: str | dict[str, Any],
         dir_key: str,
         filename: str,
         overwrite: bool = True,
+        durable: bool = False,
     ) -> None:
-        base_dir = self.config.get_path(dir_key)
-        filepath = base_dir / filename
-
-        if filepath.exists() and not overwrite:
-            self.logger.warning(f"File exists and overwrite is False: {filepath}")
-            raise FileExistsError(f"{filepath} already exists and overwrite is False.")
+        self.save_prepared(data, self.prepare(dir_key, filename), overwrite, durable)
 
-        handler = self._get_handler(filepath)
+    def save_prepared(
+        self,
+        data: str | dict[str, Any],
+        target: _PreparedTarget,
+        overwrite: bool = True,
+        durable: bool = False,
+    ) -> None:
+        filepath = target.path
         try:
-            handler.save(data, filepath)
-            self.logger.info(f"Saved file: {filepath}")
+            # No exists() pre-check: with overwrite=False the handler creates the file
+            # with O_EXCL, so an existing file is rejected by the open() call itself.
+            target.save(data, filepath, durable, excl=not overwrite)
+            self.logger.info("Saved file: %s", filepath)
+        except FileExistsError:
+            self.logger.warning("File exists and overwrite is False: %s", filepath)
+            raise FileExistsError(f"{filepath} already exists and overwrite is False.") from None
         except Exception as e:
-            self.logger.error(f"Failed to save file {filepath}: {e}")
+            self.logger.error("Failed to save file %s: %s", filepath, e)
             raise IOError(f"Failed to save {filepath}: {e}") from e
@@ -29,15 +29,18 @@ def main():
     # Modify the loaded data
     new_data = data + "\nNEW LINE!!!!! The Dodgers are losing!"
 
+    # Resolve the save target once; it is reused if the first attempt hits an existing file
+    target = file_manager.prepare(dir_key_save, filename)
+
     try:
         # Test saving with overwrite = False (will raise if file exists)
-        file_manager.save_file(new_data, dir_key_save, filename, overwrite=False)
+        file_manager.save_prepared(new_data, target, overwrite=False)
         logger.info(f"Saved {filename} to {dir_key_save} (overwrite=False)")
     except FileExistsError as e:
         logger.warning(f"File already exists, trying again with overwrite=True: {e}")
         # Now save with overwrite = True
         try:
-            file_manager.save_file(new_data, dir_key_save, filename, overwrite=True)
+            file_manager.save_prepared(new_data, target, overwrite=True)
             logger.info(f"Saved {filename} to {dir_key_save} (overwrite=True)")
         except Exception as e:
             logger.error(f"Failed to save file even with overwrite=True: {e}")
@@ -1,8 +1,12 @@
+import json
+import shutil
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
-from config.app_config import AppConfig, InvalidConfigKeyError
+from config import app_config
+from config.app_config import AppConfig, ConfigFileNotFoundError, InvalidConfigKeyError
 
 
 @pytest.fixture(scope="session")
@@ -25,3 +29,53 @@ def test_app_config_get_path(config):
 def test_app_config_invalid_key(config):
     with pytest.raises(InvalidConfigKeyError):
         config.get_path("nonexistent_dir")
+
+
+def _copy_settings(tmp_path):
+    settings = tmp_path / "settings.json"
+    shutil.copy(Path(__file__).resolve().parents[1] / "settings.json", settings)
+    return settings
+
+
+def test_app_config_settings_cache(tmp_path, monkeypatch):
+    settings = _copy_settings(tmp_path)
+
+    AppConfig(settings)
+    assert (tmp_path / "settings.json.cache").is_file()
+    assert AppConfig(settings).app_version == "0.1.0"
+
+    settings.write_text(settings.read_text().replace('"0.1.0"', '"0.10.0"'))
+    assert AppConfig(settings).app_version == "0.10.0"
+
+    # A schema change invalidates the cache even when the settings file is unchanged.
+    key = app_config._config_cache_key(settings, settings.stat())
+    monkeypatch.setattr(app_config, "_schema_fingerprint", lambda: "changed")
+    assert app_config._config_cache_key(settings, settings.stat()) != key
+
+
+def test_app_config_missing_file(tmp_path):
+    with pytest.raises(ConfigFileNotFoundError):
+        AppConfig(tmp_path / "missing.json")
+    with pytest.raises(ConfigFileNotFoundError):
+        AppConfig(tmp_path)
+
+
+@pytest.mark.skipif(app_config.ijson is None, reason="ijson is not installed")
+def test_app_config_streamed_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_config, "orjson", None)
+    monkeypatch.setattr(app_config, "_STREAM_MIN_SIZE", 0)
+    settings = _copy_settings(tmp_path)
+    assert AppConfig(settings).app_version == "0.1.0"
+
+    # Unknown keys are rejected on the streamed path too.
+    data = json.loads(settings.read_text())
+    data["unexpected"] = 1
+    settings.write_text(json.dumps(data))
+    with pytest.raises(ValidationError):
+        AppConfig(settings)
+
+
+@pytest.mark.skipif(app_config.orjson is None, reason="orjson is not installed")
+def test_app_config_mmap_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_config, "_MMAP_MIN_SIZE", 1)
+    assert AppConfig(_copy_settings(tmp_path)).app_name == "diamond-parser"
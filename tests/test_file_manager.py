@@ -1,8 +1,11 @@
 import json
+import math
+from pathlib import Path
 
 import pytest
 
 from config.app_config import AppConfig
+from core import file_manager as file_manager_module
 from core.file_manager import FileManager
 
 
@@ -67,3 +70,221 @@ def test_file_manager_unsupported_file(file_manager, tmp_path):
     test_file = tmp_path / "unsupported.xyz"
     with pytest.raises(ValueError):
         file_manager.save_file("data", "staging_data_dir", test_file.name)
+
+
+def test_file_manager_load_files(file_manager):
+    file_manager.save_file({"key": "value"}, "staging_data_dir", "sample.json")
+    file_manager.save_file("Line one\r\nLine two", "staging_data_dir", "sample.txt")
+
+    loaded = file_manager.load_files([("staging_data_dir", "sample.json"), ("staging_data_dir", "sample.txt")])
+    assert loaded == [{"key": "value"}, "Line one\nLine two"]
+
+    with pytest.raises(IOError):
+        file_manager.load_files([("staging_data_dir", "sample.json"), ("staging_data_dir", "missing.txt")])
+
+
+def test_file_manager_load_files_chunked(file_manager, monkeypatch):
+    monkeypatch.setattr(file_manager_module, "URING_BATCH_SIZE", 2)
+    file_manager.save_file({"key": "value"}, "staging_data_dir", "sample.json")
+    file_manager.save_file("Chunked", "staging_data_dir", "sample.txt")
+
+    items = [("staging_data_dir", "sample.json"), ("staging_data_dir", "sample.txt")] * 3
+    assert file_manager.load_files(items[:5]) == [{"key": "value"}, "Chunked"] * 2 + [{"key": "value"}]
+
+
+def test_file_manager_load_cached(file_manager):
+    file_manager.save_file({"key": "value", "nested": {"items": [1, 2]}}, "staging_data_dir", "sample.json")
+    first = file_manager.load_cached("staging_data_dir", "sample.json")
+    assert first["key"] == "value"
+    assert first["nested"]["items"] == (1, 2)
+    assert file_manager.load_cached("staging_data_dir", "sample.json") is first
+    with pytest.raises(TypeError):
+        first["key"] = "changed"
+    with pytest.raises(TypeError):
+        first["nested"]["key"] = "changed"
+    with pytest.raises(AttributeError):
+        first["nested"]["items"].append(3)
+
+    file_manager.save_file({"key": "changed value"}, "staging_data_dir", "sample.json")
+    assert file_manager.load_cached("staging_data_dir", "sample.json")["key"] == "changed value"
+    file_manager.clear_cache()
+
+
+def test_file_manager_save_files(file_manager):
+    file_manager.save_files(
+        [
+            ({"key": "value"}, "staging_data_dir", "sample.json"),
+            ("Batch content", "staging_data_dir", "sample.txt"),
+        ]
+    )
+    assert file_manager.load_file("staging_data_dir", "sample.json") == {"key": "value"}
+    assert file_manager.load_file("staging_data_dir", "sample.txt") == "Batch content"
+
+    with pytest.raises(IOError):
+        file_manager.save_files([("not a dict", "staging_data_dir", "sample.json")] * 2)
+
+
+requires_uring = pytest.mark.skipif(file_manager_module.liburing is None, reason="liburing is not installed")
+
+
+@requires_uring
+def test_file_manager_save_files_failed_open(file_manager, monkeypatch):
+    monkeypatch.setattr(file_manager_module, "URING_BATCH_SIZE", 2)
+    file_manager.save_file("Original content", "staging_data_dir", "sample.txt")
+
+    # A target that cannot be opened must not leave the other file in its batch modified.
+    with pytest.raises(IOError):
+        file_manager.save_files([("New", "staging_data_dir", "sample.txt"), ("x", "staging_data_dir", "no/x.txt")])
+    assert file_manager.load_file("staging_data_dir", "sample.txt") == "Original content"
+
+    # Rewriting with shorter content across several batches leaves no stale tail.
+    monkeypatch.setattr(file_manager_module, "URING_BATCH_SIZE", 1)
+    file_manager.save_files(
+        [("Short", "staging_data_dir", "sample.txt"), ({"k": 1}, "staging_data_dir", "sample.json")]
+    )
+    assert file_manager.load_files([("staging_data_dir", "sample.txt"), ("staging_data_dir", "sample.json")]) == [
+        "Short",
+        {"k": 1},
+    ]
+
+
+@requires_uring
+@pytest.mark.skipif(not Path("/dev/full").exists(), reason="needs /dev/full")
+def test_file_manager_save_files_failed_write(file_manager):
+    staging = file_manager.config.get_path("staging_data_dir")
+    file_manager.save_file("Original content that is long", "staging_data_dir", "sample.txt")
+    (staging / "full.txt").symlink_to("/dev/full")
+    try:
+        with pytest.raises(IOError):
+            file_manager.save_files(
+                [
+                    ("New", "staging_data_dir", "sample.txt"),
+                    ("x", "staging_data_dir", "full.txt"),
+                    ("Created", "staging_data_dir", "created.txt"),
+                ]
+            )
+    finally:
+        (staging / "full.txt").unlink()
+
+    # The successful write is complete (no old tail); the file the batch created is gone.
+    assert file_manager.load_file("staging_data_dir", "sample.txt") == "New"
+    assert not (staging / "created.txt").exists()
+
+
+def test_file_manager_save_files_duplicate_paths(file_manager):
+    file_manager.save_files(
+        [
+            ("First", "staging_data_dir", "sample.txt"),
+            ({"k": 1}, "staging_data_dir", "sample.json"),
+            ("Second", "staging_data_dir", "sample.txt"),
+        ]
+    )
+    assert file_manager.load_file("staging_data_dir", "sample.txt") == "Second"
+
+
+def test_file_manager_save_json_wrong_type_keeps_file(file_manager):
+    file_manager.save_file({"key": "value"}, "staging_data_dir", "sample.json")
+    with pytest.raises(IOError):
+        file_manager.save_file("not a dict", "staging_data_dir", "sample.json")
+    assert file_manager.load_file("staging_data_dir", "sample.json") == {"key": "value"}
+
+
+def test_file_manager_load_many(file_manager):
+    file_manager.save_file({"key": "value"}, "staging_data_dir", "sample.json")
+    file_manager.save_file("Threaded content", "staging_data_dir", "sample.txt")
+
+    items = [("staging_data_dir", "sample.json"), ("staging_data_dir", "sample.txt")] * 4
+    assert file_manager.load_many(items, workers=4) == [{"key": "value"}, "Threaded content"] * 4
+
+    with pytest.raises(IOError):
+        file_manager.load_many([("staging_data_dir", "sample.json"), ("staging_data_dir", "missing.json")])
+
+
+def test_file_manager_prepared_target(file_manager):
+    target = file_manager.prepare("staging_data_dir", "sample.JSON")
+
+    file_manager.save_prepared({"key": "prepared"}, target)
+    assert file_manager.load_prepared(target) == {"key": "prepared"}
+    with pytest.raises(FileExistsError):
+        file_manager.save_prepared({"key": "other"}, target, overwrite=False)
+    target.path.unlink()
+
+    with pytest.raises(ValueError):
+        file_manager.prepare("staging_data_dir", "sample.csv")
+
+
+def test_file_manager_loader(file_manager):
+    file_manager.save_file({"key": "value"}, "staging_data_dir", "sample.json")
+
+    load = file_manager.loader("staging_data_dir", ".json")
+    assert load is file_manager.loader("staging_data_dir", ".JSON")
+    assert load("sample.json") == {"key": "value"}
+
+    with pytest.raises(IOError):
+        load("missing.json")
+    with pytest.raises(ValueError):
+        file_manager.loader("staging_data_dir", ".csv")
+
+
+def test_file_manager_json_non_ascii(file_manager, monkeypatch):
+    # Exercise the stdlib encoder even where orjson is installed.
+    monkeypatch.setattr(file_manager_module, "orjson", None)
+    data = {"team": "Águilas", "city": "東京"}
+    file_manager.save_file(data, "staging_data_dir", "sample.json")
+    filepath = file_manager.config.get_path("staging_data_dir") / "sample.json"
+    assert "Águilas" in filepath.read_text(encoding="utf-8")
+    assert file_manager.load_file("staging_data_dir", "sample.json") == data
+
+
+def test_file_manager_json_orjson_fallback(file_manager):
+    data = {1: "int key", "big": 2**70, "nan": float("nan")}
+    file_manager.save_file(data, "staging_data_dir", "sample.json")
+    filepath = file_manager.config.get_path("staging_data_dir") / "sample.json"
+    text = filepath.read_text(encoding="utf-8")
+    assert str(2**70) in text and "NaN" in text
+
+    loaded = file_manager.load_file("staging_data_dir", "sample.json")
+    assert loaded["1"] == "int key"
+    assert math.isnan(loaded["nan"])
+
+
+def test_file_manager_direct_reads(file_manager, monkeypatch):
+    monkeypatch.setattr(file_manager_module, "DIRECT_READS", True)
+    monkeypatch.setattr(file_manager_module, "DIRECT_READ_MIN_SIZE", 1)
+    text = "direct\n" * 1000
+    file_manager.save_file(text, "staging_data_dir", "sample.txt")
+    assert file_manager.load_file("staging_data_dir", "sample.txt") == text
+
+
+def test_file_manager_save_json_streaming(file_manager, monkeypatch):
+    data = {"rows": [[i, f"row {i}"] for i in range(1000)], "total": 1000}
+    streamed = []
+    stream = file_manager_module.JSONFileHandler._stream
+    monkeypatch.setattr(
+        file_manager_module.JSONFileHandler,
+        "_stream",
+        staticmethod(lambda *args: streamed.append(True) or stream(*args)),
+    )
+
+    # Explicit streaming writes the same document as the one-shot encoders.
+    filepath = file_manager.config.get_path("staging_data_dir") / "sample.json"
+    file_manager_module.JSONFileHandler.save(data, filepath, streaming=True)
+    assert streamed and file_manager.load_file("staging_data_dir", "sample.json") == data
+
+    # Without orjson, nested data counts towards the size that switches streaming on.
+    streamed.clear()
+    monkeypatch.setattr(file_manager_module, "orjson", None)
+    monkeypatch.setattr(file_manager_module, "STREAMING_MIN_SIZE", 64 << 10)
+    file_manager.save_file(data, "staging_data_dir", "sample.json")
+    assert streamed and file_manager.load_file("staging_data_dir", "sample.json") == data
+
+
+@pytest.mark.skipif(file_manager_module.orjson is None, reason="orjson is not installed")
+def test_file_manager_load_json_mmap(file_manager, monkeypatch):
+    monkeypatch.setattr(file_manager_module, "MMAP_READ_MIN_SIZE", 1)
+    file_manager.save_file({"key": "value"}, "staging_data_dir", "sample.json")
+    assert file_manager.load_file("staging_data_dir", "sample.json") == {"key": "value"}
+
+    # orjson rejects NaN; the fallback has to re-read it from the mapped buffer.
+    file_manager.save_file({"nan": float("nan")}, "staging_data_dir", "sample.json")
+    assert math.isnan(file_manager.load_file("staging_data_dir", "sample.json")["nan"])